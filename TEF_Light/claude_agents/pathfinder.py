@@ -2,11 +2,15 @@
 Pathfinder agent - the strategic navigator for searching optimal paths through the solution space.
 """
 
+import logging
 from typing import Optional
 from .base import BaseClaudeAgent
 from models import TaskNode
 
 
+_log = logging.getLogger(__name__)
+
+
 class Pathfinder(BaseClaudeAgent):
     """Strategic pathfinder agent that searches for optimal paths through the solution space."""
     
@@ -59,7 +63,7 @@ class Pathfinder(BaseClaudeAgent):
 
         # Handle errors - return None to indicate no plan update
         if "error" in result:
-            print(f"Pathfinding failed: {result['error']}")
+            _log.warning("Pathfinding failed: %s", result['error'])
             return None
 
         # Pydantic will validate the structure
@@ -6,6 +6,7 @@ and automatic JSON schema generation for structured outputs.
 """
 
 import json
+from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional, Literal
 
@@ -102,7 +103,7 @@ class TaskTree(BaseModel):
     )
 
     @classmethod
-    def load_from_file(cls, file_path: str) -> 'TaskTree':
+    def load_from_file(cls, file_path: str | Path) -> 'TaskTree':
         """Load and validate task tree from JSON file."""
         with open(file_path, 'r') as f:
             data = json.load(f)
@@ -114,10 +115,15 @@ class TaskTree(BaseModel):
         # Otherwise expect it to have a 'root' key
         return cls.model_validate(data)
 
-    def save_to_file(self, file_path: str) -> None:
+    def to_json(self) -> str:
+        """Serialize task tree in the on-disk plan file format."""
+        # Serialize directly to JSON rather than model_dump() followed by json.dump
+        return self.model_dump_json(indent=2)
+
+    def save_to_file(self, file_path: str | Path) -> None:
         """Save task tree to JSON file."""
-        with open(file_path, 'w') as f:
-            json.dump(self.model_dump(), f, indent=2)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
 
 
 # Enable forward references for recursive TaskNode model
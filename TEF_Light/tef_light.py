@@ -6,19 +6,20 @@ A minimal implementation of the Act→Assess→Adapt cycle using Claude SDK
 with structured outputs for reliable task orchestration.
 """
 
-import json
+import logging
 import subprocess
+import sys
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional, TextIO
 
 from claude_agents import TaskExecutor, TaskAssessor, Pathfinder
 from models import ExecutionResult, AssessmentResult, TaskNode, TaskTree
 from templates import TemplateManager
 
 
-
+_log = logging.getLogger("tef_light")
 
 # Initialize specialized agents
 task_executor = TaskExecutor()
@@ -26,10 +27,17 @@ task_assessor = TaskAssessor()
 pathfinder = Pathfinder()
 
 
-def _init_project(base_path: str, task_plan_path: str, project_id: Optional[str] = None) -> None:
-    """Initialize project structure and global paths."""
+def _init_project(base_path: str, task_plan_path: str, project_id: Optional[str] = None,
+                  commit_per_phase: bool = False) -> None:
+    """Initialize project structure and global paths.
+
+    By default the ACT/ASSESS/ADAPT phases of a task are committed to git together once the
+    task's iteration finishes; commit_per_phase=True commits after every recorded phase instead.
+    """
+    # One timestamp for the run id and the audit log header
+    started_at = datetime.now()
     if project_id is None:
-        project_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        project_id = started_at.strftime("%Y%m%d_%H%M%S")
     
     # Validate project setup
     if not project_id or not project_id.strip():
@@ -37,9 +45,12 @@ def _init_project(base_path: str, task_plan_path: str, project_id: Optional[str]
     
     base_dir = Path(base_path)
     project_dir = base_dir / "runs" / project_id
+
+    # Callers that never configured logging still get the progress output print() used to give
+    _ensure_log_output()
     
     # Initialize all project paths
-    global _template_manager, _project_dir, _project_id, _audit_log_path, _user_intent_path, _working_plan_path, _original_intent_file, _working_plan_file
+    global _template_manager, _project_dir, _project_id, _audit_log_path, _user_intent_path, _working_plan_path, _original_intent_file, _working_plan_file, _original_intent, _is_git_repo, _commit_per_phase, _pending_commits
     
     _template_manager = TemplateManager(base_dir / "prompt-templates")
     
@@ -62,17 +73,38 @@ def _init_project(base_path: str, task_plan_path: str, project_id: Optional[str]
     
     shutil.copy2(task_plan_file, _original_intent_file)
     shutil.copy2(task_plan_file, _working_plan_file)
+
+    # Original user intent is the immutable "north star" - read it once rather than on every adapt
+    _original_intent = _original_intent_file.read_text()
     
+    # Check for a git repository once instead of letting every record() commit fail
+    _is_git_repo = subprocess.run(['git', 'rev-parse', '--git-dir'], capture_output=True).returncode == 0
+    _commit_per_phase = commit_per_phase
+    _pending_commits = []
+
     # Initialize audit log
-    _init_audit_log()
+    _init_audit_log(started_at)
 
 
 def execute_project(environment_path: str) -> None:
     """Execute the complete project plan using the task framework."""
+    global _working_plan_content, _audit_log_file
+
     # Load and validate task tree from working plan (already copied during init)
-    task_tree = TaskTree.load_from_file(str(_working_plan_file))
-    
-    execute_task(task_tree.root, environment_path)
+    task_tree = TaskTree.load_from_file(_working_plan_file)
+
+    # Baseline for skipping rewrites of an unchanged plan
+    _working_plan_content = task_tree.to_json()
+
+    # Keep the audit log open for the run; record() appends and flushes each entry
+    _audit_log_file = open(_audit_log_path, 'a', encoding='utf-8')
+    try:
+        execute_task(task_tree.root, environment_path)
+    finally:
+        # Commit whatever an interrupted iteration recorded
+        _flush_commits()
+        _audit_log_file.close()
+        _audit_log_file = None
 
 
 
@@ -94,51 +126,62 @@ def execute_task(task_tree: TaskNode, environment_path: str) -> None:
             record(f"ACT: {task.id}", phase="ACT", 
                   details=_format_execution_report(task, execution_result))
 
+        # Serialize the tree once per iteration; it doesn't change between Assess and Adapt
+        tree_json = task_tree.model_dump_json(indent=2)
+
         # Assess (all tasks)
         # TODO: we need to adjust this eventually to assess parent/non-atomic tasks after all their children are done, with some diff of what changed
-        assessment = assess(task, task_tree, execution_result, environment_path)
+        assessment = assess(task, tree_json, execution_result, environment_path)
         
         # Record assessment summary
         record(f"ASSESS: {task.id}", phase="ASSESS", 
               details=_format_assessment_report(task, assessment))
 
         # Adapt (all tasks)
-        updated_tree = adapt(task, assessment, task_tree, environment_path)
+        updated_tree = adapt(task, assessment, tree_json, environment_path)
+        adapt_details = "No changes needed, proceeding as planned"
         if updated_tree:
             # Update the tree with adapted changes
             task_tree = updated_tree
-            # Save evolving working plan
-            _save_working_plan(task_tree)
-            adapt_details = "Plan updated with modifications"
-        else:
-            adapt_details = "No changes needed, proceeding as planned"
+            # Save evolving working plan; only report modifications if the plan actually changed
+            save_status = _save_working_plan(task_tree)
+            if save_status == "written":
+                adapt_details = "Plan updated with modifications"
+            elif save_status == "failed":
+                adapt_details = "Plan updated with modifications (failed to save working plan)"
         
         record(f"ADAPT: {task.id}", phase="ADAPT", details=adapt_details)
 
         # Mark task as completed
         task.status = "completed"
 
+        # One commit per task, so its history only holds that task's changes
+        _flush_commits()
+
 
 # Task tree navigation
 def find_next_task(tree: TaskNode) -> TaskNode | None:
     """Find the next atomic (leaf) task that's pending using depth-first traversal."""
-    # If this task is atomic (no children) and pending, return it
-    if not tree.children and tree.status == "pending":
-        return tree
+    # Explicit stack instead of recursion; children are pushed in reverse so they pop in order
+    stack = [tree]
+    while stack:
+        node = stack.pop()
 
-    # Otherwise, check children depth-first
-    if tree.children:
-        for child in tree.children:
-            next_task = find_next_task(child)
-            if next_task:
-                return next_task
+        # If this task is atomic (no children) and pending, return it
+        if not node.children:
+            if node.status == "pending":
+                return node
+            continue
+
+        # Otherwise, check children depth-first
+        stack.extend(reversed(node.children))
 
     return None
 
 
 def execute(task: TaskNode, environment_path: str) -> ExecutionResult:
     """Execute an atomic task and return comprehensive results."""
-    print(f"Executing: {task.description}")
+    _log.info("Executing: %s", task.description)
 
     # Render prompt using template system
     prompt = _template_manager.render(
@@ -164,7 +207,7 @@ def execute(task: TaskNode, environment_path: str) -> ExecutionResult:
     return execution_result
 
 
-def assess(task: TaskNode, tree: TaskNode, execution_result: ExecutionResult | None, environment_path: str) -> AssessmentResult:
+def assess(task: TaskNode, tree_json: str, execution_result: ExecutionResult | None, environment_path: str) -> AssessmentResult:
     """Assess from multiple perspectives using Claude."""
     
     # Format execution info if available
@@ -188,50 +231,38 @@ Errors: {execution_result.errors}
         task_id=task.id,
         task_description=task.description,
         execution_info=execution_info,
-        task_tree_context=f"Full task tree: {json.dumps(tree.model_dump(), indent=2)}",
+        task_tree_context=f"Full task tree: {tree_json}",
         environment_path=environment_path
     )
 
     return task_assessor.assess(prompt)
 
 
-def adapt(task: TaskNode, obs: AssessmentResult, tree: TaskNode, environment_path: str) -> TaskNode | None:
+def adapt(task: TaskNode, obs: AssessmentResult, tree_json: str, environment_path: str) -> TaskNode | None:
     """Navigate/adapt the plan based on observations."""
     
-    # Load original user intent for "north star" reference
-    original_intent = _original_intent_file.read_text()
-    
     # Format observations for template
-    observations_text = f"""
-Build Perspective:
-- Feasible: {obs.build.feasible}
-- Blockers: {obs.build.blockers}
-- Observations: {obs.build.observations}
-
-Requirements Perspective:
-- Feasible: {obs.requirements.feasible}
-- Blockers: {obs.requirements.blockers}
-- Observations: {obs.requirements.observations}
-
-Integration Perspective:
-- Feasible: {obs.integration.feasible}
-- Blockers: {obs.integration.blockers}
-- Observations: {obs.integration.observations}
-
-Quality Perspective:
-- Feasible: {obs.quality.feasible}
-- Blockers: {obs.quality.blockers}
-- Observations: {obs.quality.observations}
-"""
+    observations_text = "\n" + "\n\n".join(
+        f"{label} Perspective:\n"
+        f"- Feasible: {perspective.feasible}\n"
+        f"- Blockers: {perspective.blockers}\n"
+        f"- Observations: {perspective.observations}"
+        for label, perspective in (
+            ("Build", obs.build),
+            ("Requirements", obs.requirements),
+            ("Integration", obs.integration),
+            ("Quality", obs.quality),
+        )
+    ) + "\n"
 
     # Render prompt using template system
     prompt = _template_manager.render(
         "plan_adaptation",
         task_id=task.id,
         task_description=task.description,
-        original_user_intent=original_intent,
+        original_user_intent=_original_intent,
         observations=observations_text,
-        task_tree=json.dumps(tree.model_dump(), indent=2),
+        task_tree=tree_json,
         environment_path=environment_path
     )
 
@@ -244,94 +275,151 @@ _template_manager: TemplateManager
 _project_dir: Path
 _project_id: str
 _audit_log_path: Path
+_audit_log_file: TextIO | None = None
 _user_intent_path: Path
 _working_plan_path: Path
 _original_intent_file: Path
 _working_plan_file: Path
+_working_plan_content: str
+_original_intent: str
+_is_git_repo: bool
+_commit_per_phase: bool
+_pending_commits: list[str]
+
 
+def _save_working_plan(root_task: TaskNode) -> Literal["written", "unchanged", "failed"]:
+    """Save current working plan to working_plan directory.
 
-def _save_working_plan(root_task: TaskNode) -> None:
-    """Save current working plan to working_plan directory."""
+    Returns whether the plan file was written, left alone because the plan is unchanged,
+    or could not be saved.
+    """
+    global _working_plan_content
     try:
         # Create a TaskTree wrapper for consistent saving
         current_tree = TaskTree(root=root_task)
-        current_tree.save_to_file(str(_working_plan_file))
-        print(f"Saved working plan: {_working_plan_file}")
+        content = current_tree.to_json()
+
+        # The Pathfinder often returns the plan unchanged - skip rewriting identical content
+        if content == _working_plan_content:
+            _log.debug("Working plan unchanged, not rewriting: %s", _working_plan_file)
+            return "unchanged"
+
+        current_tree.save_to_file(_working_plan_file)
+        _working_plan_content = content
+        _log.info("Saved working plan: %s", _working_plan_file)
+        return "written"
     except Exception as e:
-        print(f"Warning: Failed to save working plan: {e}")
+        _log.warning("Failed to save working plan: %s", e)
+        return "failed"
+
+
+def _ensure_log_output() -> None:
+    """Send progress messages to stdout if the application hasn't configured logging."""
+    if _log.hasHandlers():
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _log.addHandler(handler)
+    if _log.level == logging.NOTSET:
+        _log.setLevel(logging.INFO)
 
 
-def _init_audit_log() -> None:
+def _init_audit_log(started_at: datetime) -> None:
     """Initialize audit log file for the current project."""
-    from datetime import datetime
-    
-    with open(_audit_log_path, 'w') as f:
+    with open(_audit_log_path, 'w', encoding='utf-8') as f:
         f.write(f"# TEF Light Execution Log - Project {_project_id}\n")
-        f.write(f"# Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"# Started: {started_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
 
 def _format_execution_report(task: TaskNode, execution_result: ExecutionResult) -> str:
     """Format execution results into human-readable report."""
-    report = f"Executed task: {task.description}"
-    report += f" | Status: {execution_result.status}"
-    report += f" | Files: {len(execution_result.files_modified)}"
-    report += f" | Changes: {execution_result.changes_made[:100]}"
+    # Collect the fields and join once instead of rebuilding the string per field
+    fields = [
+        f"Executed task: {task.description}",
+        f"Status: {execution_result.status}",
+        f"Files: {len(execution_result.files_modified)}",
+        f"Changes: {execution_result.changes_made[:100]}",
+    ]
     if execution_result.errors:
-        report += f" | Errors: {len(execution_result.errors)}"
-    return report
+        fields.append(f"Errors: {len(execution_result.errors)}")
+    return " | ".join(fields)
 
 
 def _format_assessment_report(task: TaskNode, assessment_result: AssessmentResult) -> str:
     """Format assessment results into human-readable report."""
-    report = f"Assessment completed for task: {task.description}"
-    
     # Format the 4 assessment perspectives
-    perspectives = []
-    for name, assessment in [
-        ("Build", assessment_result.build),
-        ("Requirements", assessment_result.requirements), 
-        ("Integration", assessment_result.integration),
-        ("Quality", assessment_result.quality)
-    ]:
-        status = "pass" if assessment.feasible else "fail"
-        perspectives.append(f"{name}={status}")
+    perspectives = ", ".join(
+        f"{name}={'pass' if assessment.feasible else 'fail'}"
+        for name, assessment in (
+            ("Build", assessment_result.build),
+            ("Requirements", assessment_result.requirements),
+            ("Integration", assessment_result.integration),
+            ("Quality", assessment_result.quality),
+        )
+    )
     
-    report += f" | Assessment: {', '.join(perspectives)}"
-    return report
+    return f"Assessment completed for task: {task.description} | Assessment: {perspectives}"
 
 
 def record(msg: str, phase: Optional[str] = None, details: Optional[str] = None) -> None:
     """Record progress with both logging and git commits"""
-    from datetime import datetime
-    
-    print(msg)
+    _log.info("%s", msg)
     
     # Write to audit log
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     log_entry = f"[{timestamp}] {phase}: {details}\n" if (phase and details) else f"[{timestamp}] {msg}\n"
     
-    # Write to main execution log
-    with open(_audit_log_path, 'a') as f:
-        f.write(log_entry)
+    # Append to main execution log; flush per entry so a killed run keeps everything recorded so far
+    if _audit_log_file is None:
+        raise RuntimeError("record() called outside execute_project()")
+    _audit_log_file.write(log_entry)
+    _audit_log_file.flush()
     
     # Also write to task-specific log if we have a task ID
-    if ':' in msg:  # Format: "PHASE: task-id" or "ACT: task-id", etc.
-        parts = msg.split(': ', 1)
-        if len(parts) == 2:
-            task_id = parts[1]
-            task_log_path = _project_dir / f"{task_id}.log"
-            with open(task_log_path, 'a') as f:
-                f.write(log_entry)
+    # Format: "PHASE: task-id" or "ACT: task-id", etc. - partition scans the message once
+    _, sep, task_id = msg.partition(': ')
+    if sep:
+        task_log_path = _project_dir / f"{task_id}.log"
+        with open(task_log_path, 'a') as f:
+            f.write(log_entry)
+
+    _pending_commits.append(msg)
+    if _commit_per_phase:
+        _flush_commits()
+
+
+def _flush_commits() -> None:
+    """Commit all pending recorded phases as a single git commit."""
+    if not _pending_commits:
+        return
+
+    # First message becomes the subject, the rest of the batch goes in the body
+    message = _pending_commits[0]
+    if len(_pending_commits) > 1:
+        message += "\n\n" + "\n".join(_pending_commits[1:])
+    _pending_commits.clear()
+
+    _git_commit(message)
+
+
+def _git_commit(message: str) -> None:
+    """Stage all changes and commit them with the given message."""
+    if not _is_git_repo:
+        return
 
     try:
         # Stage all changes
         subprocess.run(['git', 'add', '-A'], check=True, capture_output=True)
         # Commit with the message
-        subprocess.run(['git', 'commit', '-m', msg], check=True, capture_output=True)
+        subprocess.run(['git', 'commit', '-m', message], check=True, capture_output=True, text=True)
     except subprocess.CalledProcessError as e:
-        print(f"Git commit failed: {e}")
+        # Nothing staged (e.g. ASSESS, or ADAPT without plan changes) is not a failure
+        if e.stdout and "nothing to commit" in e.stdout:
+            return
+        _log.warning("Git commit failed: %s", e)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     _init_project("./tef_light/projects/todo_app", "todo_app.json")
     execute_project("./tef_light/projects/todo_app/take1")
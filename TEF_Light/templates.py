@@ -6,16 +6,29 @@ for structured, maintainable prompt generation.
 """
 
 from string import Template
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True)
 class PromptTemplate:
     """A prompt template with variable substitution support."""
     
     template: str
+    _compiled: Template = field(init=False, repr=False, compare=False)
+    _identifiers: frozenset[str] = field(init=False, repr=False, compare=False)
+    _static_text: str | None = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Compile once; cached templates are rendered many times per run.
+        # Frozen so the derived fields below can never drift from `template`.
+        compiled = Template(self.template)
+        identifiers = frozenset(compiled.get_identifiers())
+        object.__setattr__(self, '_compiled', compiled)
+        object.__setattr__(self, '_identifiers', identifiers)
+        # Templates without placeholders always render the same; resolve them ($$ escapes included) up front
+        object.__setattr__(self, '_static_text', None if identifiers else compiled.safe_substitute())
     
     def render(self, **variables: Any) -> str:
         """
@@ -24,23 +37,32 @@ class PromptTemplate:
         Complex variables (dicts, lists, long strings) are wrapped in XML tags.
         Simple variables are substituted inline.
         """
+        if self._static_text is not None:
+            return self._static_text
+        
         formatted_vars = {}
         
         for key, value in variables.items():
-            if self._is_complex_variable(value):
+            # Variables the template never references would be discarded anyway - don't format them
+            if key not in self._identifiers:
+                continue
+            
+            # Convert once and reuse for both the complexity check and the substitution
+            str_value = str(value)
+            if self._is_complex_variable(value, str_value):
                 # Wrap complex variables in XML tags as recommended by Anthropic
-                formatted_vars[key] = f"<{key}>\n{value}\n</{key}>"
+                formatted_vars[key] = f"<{key}>\n{str_value}\n</{key}>"
             else:
-                formatted_vars[key] = str(value)
+                formatted_vars[key] = str_value
         
-        return Template(self.template).safe_substitute(**formatted_vars)
+        # Pass the mapping directly; **-splatting it would just copy it into a new kwargs dict
+        return self._compiled.safe_substitute(formatted_vars)
     
-    def _is_complex_variable(self, value: Any) -> bool:
+    def _is_complex_variable(self, value: Any, str_value: str) -> bool:
         """Determine if a variable should be wrapped in XML tags."""
         if isinstance(value, (dict, list)):
             return True
         
-        str_value = str(value)
         # Consider strings longer than 50 chars or with newlines as complex
         return len(str_value) > 50 or '\n' in str_value
 
@@ -57,11 +79,13 @@ class TemplateManager:
         if name not in self._cache:
             template_path = self.template_dir / f"{name}.md"
             
-            if not template_path.exists():
-                raise FileNotFoundError(f"Template not found: {template_path}")
+            # Single read; a missing file surfaces here instead of via a separate exists() check
+            try:
+                content = template_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Template not found: {template_path}") from None
             
-            with open(template_path, 'r', encoding='utf-8') as f:
-                self._cache[name] = PromptTemplate(f.read())
+            self._cache[name] = PromptTemplate(content)
         
         return self._cache[name]
     